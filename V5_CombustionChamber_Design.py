@@ -1,200 +1,381 @@
 import math
+import sys
+from collections.abc import Mapping
+from dataclasses import dataclass, fields, replace
+from functools import lru_cache
+from types import MappingProxyType
+
+#--- numeric kernels (scalars in, tuples out) ---
+def _thermo(PR, eff_c, exp_isen, R, T_amb=288.15, P_amb=101325):
+    P2 = P_amb * PR #compressor exit
+    T2_iso = T_amb * (PR**exp_isen) #exp_isen = (gamma-1)/gamma
+    T2 = T_amb + (T2_iso - T_amb) / eff_c
+    rho2 = P2 / (R * T2)
+    return P2, T2, rho2
+
+def _mass_flow_and_fuel(m_air, T2, target_tit, cp_avg, LHV, comb_eff=0.96):
+    energy_req = m_air * cp_avg * (target_tit - T2)
+    m_fuel = energy_req / (LHV * comb_eff)
+    return m_fuel, m_air / m_fuel
+
+def _zonal(m_air_total, m_fuel, T_inlet, stoich, LHV, cp_flame,
+           phi_primary=1.6, phi_secondary_target=0.6):
+    m_air_pri = (m_fuel * stoich) / phi_primary
+    m_air_cumulative_target = (m_fuel * stoich) / phi_secondary_target #air required to hit phi=.6
+    m_air_sec = m_air_cumulative_target - m_air_pri
+    m_air_dil = m_air_total - m_air_pri - m_air_sec #dil. zone
+    if m_air_dil < 0:
+        m_air_dil = 0
+        m_air_sec = m_air_total - m_air_pri
+    #temp est.
+    m_fuel_burned = m_air_pri / stoich
+    Q_zone1 = m_fuel_burned * LHV
+    m_total_zone1 = m_air_pri + m_fuel
+    delta_T = Q_zone1 / (m_total_zone1 * cp_flame)
+    return m_air_pri, m_air_sec, m_air_dil, T_inlet + delta_T
+
+# NASA 7-coeff. fit for air (Burcat), cp/R = a1 + a2*T + a3*T^2 + a4*T^3 + a5*T^4
+_R_AIR = 287.05
+_CP_COEFFS_LOW = (3.56839620E+00, -6.78729429E-04, 1.55371476E-06, -3.29937060E-12,
+                  -4.66395387E-13, -1.06234659E+03, 3.71582965E+00)   # 200-1000 K
+_CP_COEFFS_HIGH = (3.08792717E+00, 1.24597184E-03, -4.23718945E-07, 6.74774789E-11,
+                   -3.97076972E-15, -9.95262755E+02, 5.95960930E+00)  # 1000-6000 K
+_CP_COEFFS = (_CP_COEFFS_LOW, _CP_COEFFS_HIGH) # indexed by T >= 1000
+
+@lru_cache(maxsize=512)
+def _cp_air(T_kelvin): #callers pass whole kelvin so repeats hit the cache
+    T = max(200, min(T_kelvin, 2000))
+    a = _CP_COEFFS[T >= 1000]
+    return _R_AIR * (a[0] + T*(a[1] + T*(a[2] + T*(a[3] + T*a[4])))) #horner
+
+@dataclass(slots=True, eq=False)
+class CombustorResults(Mapping):
+    """
+    Outputs of MicroJetCombustor. A field stays None until the stage that
+    computes it has run; it reads like a read-only dict of the set fields
+    (res['key'], 'key' in res, items(), == dict) so reports keep working
+    """
+    #thermo
+    P2_Pa: float | None = None
+    T2_K: float | None = None
+    rho2: float | None = None
+    #flow budget
+    mdot_air: float | None = None
+    mdot_fuel: float | None = None
+    overall_AFR: float | None = None
+    cp_used: float | None = None
+    #zonal
+    split_primary: float | None = None
+    split_secondary: float | None = None
+    split_dilution: float | None = None
+    T_primary_zone_est: float | None = None
+    #geometry
+    casing_id_mm: float | None = None
+    liner_od_mm: float | None = None
+    liner_id_mm: float | None = None
+    chamber_length_mm: float | None = None
+    annulus_gap_mm: float | None = None
+    #vaporizers
+    vap_n: int | None = None
+    vap_od_mm: float | None = None
+    vap_id_mm: float | None = None
+    vap_exit_velocity: float | None = None
+    vap_bend_radius_mm: float | None = None
+    #holes
+    holes_pri_qty: int | None = None
+    holes_pri_mm: float | None = None
+    holes_sec_qty: int | None = None
+    holes_sec_mm: float | None = None
+    holes_dil_qty: int | None = None
+    holes_dil_mm: float | None = None
+
+    def __getitem__(self, key):
+        if key in _RESULT_FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key not in _RESULT_FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in _RESULT_FIELDS and getattr(self, key) is not None
+
+    def __iter__(self):
+        for k in RESULT_KEYS:
+            if getattr(self, k) is not None:
+                yield k
+
+    def __len__(self):
+        return sum(getattr(self, k) is not None for k in RESULT_KEYS)
+
+    def as_dict(self):
+        """
+        Plain dict of the set fields (e.g. for json.dumps)
+        """
+        return {k: getattr(self, k) for k in self}
+
+# canonical output names, in pipeline order
+RESULT_KEYS = tuple(f.name for f in fields(CombustorResults))
+_RESULT_FIELDS = frozenset(RESULT_KEYS)
 
 class MicroJetCombustor:
+    # cp is a property of air, not of the instance, so one cache serves every
+    # combustor and subclass
+    _get_cp = staticmethod(_cp_air)
+
+    R = 287.05
+    GAMMA = 1.4
+
+    # read-only and shared by all instances, subclass and override to change
+    # them (run() caches per class)
+    DESIGN_PARAMS = MappingProxyType({
+        'target_annulus_vel': 35.0,  # m/s (Low to ensure even feed)
+        'target_tube_liq_vel': 3.0,  # m/s (To prevent vapor lock/dribble)
+        'target_pressure_drop': 0.04, # 4% dP across liner
+        'discharge_coeff_hole': 0.60, # sharo edge hol asmp.
+        'max_LD_ratio': 1.65          # L?D for shaft stability
+    })
+    # Fuel (Jet-A / Kerosene)
+    FUEL = MappingProxyType({
+        "LHV": 43.0e6,
+        "STOICH_AFR": 14.7,  # theoretical perf burn
+        "RHO_LIQ": 800.0,
+        "T_BOIL": 450.0      # K (aprox vap. T)
+    })
+    _CLASS_CONSTANTS = frozenset(('R', 'GAMMA', 'DESIGN_PARAMS', 'FUEL'))
+
     def __init__(self, inputs):
         self.inputs = inputs
-        self.res = {}
-        self.R = 287.05
-        self.GAMMA = 1.4
-        
-        self.DESIGN_PARAMS = {
-            'target_annulus_vel': 35.0,  # m/s (Low to ensure even feed)
-            'target_tube_liq_vel': 3.0,  # m/s (To prevent vapor lock/dribble)
-            'target_pressure_drop': 0.04, # 4% dP across liner
-            'discharge_coeff_hole': 0.60, # sharo edge hol asmp.
-            'max_LD_ratio': 1.65          # L?D for shaft stability
-        }
-        # Fuel (Jet-A / Kerosene)
-        self.FUEL = {
-            "LHV": 43.0e6,
-            "STOICH_AFR": 14.7,  # theoretical perf burn
-            "RHO_LIQ": 800.0,
-            "T_BOIL": 450.0      # K (aprox vap. T)
-        }
-    def _get_cp(self, T_kelvin):
-        T = max(200, min(T_kelvin, 2000))
-        cp = 950 + (0.21 * T) 
-        return cp
+        self.res = CombustorResults()
+
+    def __setattr__(self, name, value):
+        if name in self._CLASS_CONSTANTS:
+            raise AttributeError(f"{name} is a class constant, subclass {type(self).__name__} to change it")
+        object.__setattr__(self, name, value)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._bind_constants() #keep in step with overridden constants
+
+    @classmethod
+    def _bind_constants(cls):
+        """
+        Unpacks GAMMA, DESIGN_PARAMS and FUEL into private class attributes once
+        per class, so the pipeline doesn't go through the dicts every run
+        """
+        cls._EXP_ISEN = (cls.GAMMA - 1) / cls.GAMMA
+        cls._V_ANNULUS = cls.DESIGN_PARAMS['target_annulus_vel']
+        cls._V_TUBE_LIQ = cls.DESIGN_PARAMS['target_tube_liq_vel']
+        cls._DP_LINER = cls.DESIGN_PARAMS['target_pressure_drop']
+        cls._CD_HOLE = cls.DESIGN_PARAMS['discharge_coeff_hole']
+        cls._MAX_LD = cls.DESIGN_PARAMS['max_LD_ratio']
+        cls._LHV = cls.FUEL['LHV']
+        cls._STOICH_AFR = cls.FUEL['STOICH_AFR']
+        cls._RHO_LIQ = cls.FUEL['RHO_LIQ']
+        cls._T_BOIL = cls.FUEL['T_BOIL']
+
+    def with_overrides(self, **kw):
+        """
+        Copy of this combustor with some inputs changed and empty results
+        """
+        new = object.__new__(type(self))
+        new.__dict__.update(self.__dict__)
+        new.inputs = {**self.inputs, **kw}
+        new.res = CombustorResults()
+        return new
+
+    def _air_mass_flow(self):
+        if self.inputs.get('mass_flow_air_kg_s') is not None: #air mass flow
+            return self.inputs['mass_flow_air_kg_s']
+        ref_od = 0.1524 # based on 6 in case
+        ref_flow = 0.45 
+        return ref_flow * ((self.inputs['casing_od_inch']*0.0254)**2 / ref_od**2)
 
     def thermodynamics(self): #air entering comb.
-        P_amb = 101325
-        T_amb = 288.15
-        PR = self.inputs['pressure_ratio']
-        eff_c = self.inputs['compressor_efficiency']
-        P2 = P_amb * PR #compressor exit
-        T2_iso = T_amb * (PR**((self.GAMMA - 1)/self.GAMMA))
-        T2 = T_amb + (T2_iso - T_amb) / eff_c
-        
-        rho2 = P2 / (self.R * T2)
-        self.res['P2_Pa'] = P2
-        self.res['T2_K'] = T2
-        self.res['rho2'] = rho2
+        res = self.res
+        res.P2_Pa, res.T2_K, res.rho2 = _thermo(
+            self.inputs['pressure_ratio'], self.inputs['compressor_efficiency'], self._EXP_ISEN, self.R)
 
     def mass_flow_and_fuel(self):
-        if self.inputs.get('mass_flow_air_kg_s') is not None: #air mass flow
-            m_air = self.inputs['mass_flow_air_kg_s']
-        else: 
-            ref_od = 0.1524 # based on 6 in case
-            ref_flow = 0.45 
-            m_air = ref_flow * ((self.inputs['casing_od_inch']*0.0254)**2 / ref_od**2)
+        res = self.res
+        T2 = res.T2_K
+        m_air = self._air_mass_flow()
         target_tit = self.inputs['target_tit_k'] #fuel flow
-        T2 = self.res['T2_K']
-        T_avg = (target_tit + T2) / 2
-        cp_avg = self._get_cp(T_avg)
-        comb_eff = 0.96
-        energy_req = m_air * cp_avg * (target_tit - T2)
-        m_fuel = energy_req / (self.FUEL['LHV'] * comb_eff)
-        self.res['mdot_air'] = m_air
-        self.res['mdot_fuel'] = m_fuel
-        self.res['overall_AFR'] = m_air / m_fuel
-        self.res['cp_used'] = cp_avg
+        cp_avg = self._get_cp(round((target_tit + T2) / 2))
+        res.mdot_fuel, res.overall_AFR = _mass_flow_and_fuel(m_air, T2, target_tit, cp_avg, self._LHV)
+        res.mdot_air, res.cp_used = m_air, cp_avg
 
     def zonal_analysis(self): #air split calc
-        m_fuel = self.res['mdot_fuel']
-        stoich = self.FUEL['STOICH_AFR']
-        m_air_total = self.res['mdot_air']
-        
-        phi_primary = 1.6
-        m_air_pri = (m_fuel * stoich) / phi_primary
-        
-        phi_secondary_target = 0.6 
-        
-        m_air_cumulative_target = (m_fuel * stoich) / phi_secondary_target #air required to hit phi=.6
-        m_air_sec = m_air_cumulative_target - m_air_pri
-        m_air_dil = m_air_total - m_air_pri - m_air_sec #dil. zone
-        if m_air_dil < 0:
-            m_air_dil = 0
-            m_air_sec = m_air_total - m_air_pri
-        self.res['split_primary'] = m_air_pri
-        self.res['split_secondary'] = m_air_sec
-        self.res['split_dilution'] = m_air_dil
-        #temp est.
-        cp_flame = self._get_cp(2000)
-        T_inlet = self.res['T2_K']
-        m_fuel_burned = m_air_pri / stoich 
-        Q_zone1 = m_fuel_burned * self.FUEL['LHV']
-        m_total_zone1 = m_air_pri + m_fuel
-        delta_T = Q_zone1 / (m_total_zone1 * cp_flame)
-        self.res['T_primary_zone_est'] = T_inlet + delta_T
+        res = self.res
+        (res.split_primary, res.split_secondary, res.split_dilution,
+         res.T_primary_zone_est) = _zonal(res.mdot_air, res.mdot_fuel, res.T2_K,
+                                          self._STOICH_AFR, self._LHV, self._get_cp(2000))
+
+    def _full_pipeline(self):
+        """
+        thermodynamics -> mass_flow_and_fuel -> zonal_analysis in one pass,
+        intermediates stay local and res is written once at the end
+        """
+        inputs, lhv = self.inputs, self._LHV
+        P2, T2, rho2 = _thermo(inputs['pressure_ratio'], inputs['compressor_efficiency'], self._EXP_ISEN, self.R)
+        m_air = self._air_mass_flow()
+        target_tit = inputs['target_tit_k']
+        cp_avg = self._get_cp(round((target_tit + T2) / 2))
+        m_fuel, afr = _mass_flow_and_fuel(m_air, T2, target_tit, cp_avg, lhv)
+        m_air_pri, m_air_sec, m_air_dil, T_pri = _zonal(m_air, m_fuel, T2, self._STOICH_AFR,
+                                                        lhv, self._get_cp(2000))
+        res = self.res
+        res.P2_Pa, res.T2_K, res.rho2 = P2, T2, rho2
+        res.mdot_air, res.mdot_fuel, res.overall_AFR, res.cp_used = m_air, m_fuel, afr, cp_avg
+        res.split_primary, res.split_secondary, res.split_dilution = m_air_pri, m_air_sec, m_air_dil
+        res.T_primary_zone_est = T_pri
 
     def mechanical_geometry(self):
         """
         Sizes Casing/Liner based on velocity heuristics and wall thickness
         """
+        res = self.res
         od_m = self.inputs['casing_od_inch'] * 0.0254
         wall_m = self.inputs['wall_thickness_mm'] / 1000.0
         casing_id = od_m - (2 * wall_m)
         #annulus vel. sizing
-        v_ann = self.DESIGN_PARAMS['target_annulus_vel']
-        area_annulus = self.res['mdot_air'] / (self.res['rho2'] * v_ann)
+        v_ann = self._V_ANNULUS
+        area_annulus = res.mdot_air / (res.rho2 * v_ann)
         r_casing = casing_id / 2 #liner outer rad.
         r_liner = math.sqrt(r_casing**2 - (area_annulus / math.pi))
         liner_od = r_liner * 2
         liner_id = liner_od - (2 * wall_m)
-        length = liner_od * self.DESIGN_PARAMS['max_LD_ratio']
-        self.res['casing_id_mm'] = casing_id * 1000
-        self.res['liner_od_mm'] = liner_od * 1000
-        self.res['liner_id_mm'] = liner_id * 1000
-        self.res['chamber_length_mm'] = length * 1000
-        self.res['annulus_gap_mm'] = (casing_id - liner_od) / 2 * 1000
+        length = liner_od * self._MAX_LD
+        res.casing_id_mm = casing_id * 1000
+        res.liner_od_mm = liner_od * 1000
+        res.liner_id_mm = liner_id * 1000
+        res.chamber_length_mm = length * 1000
+        res.annulus_gap_mm = (casing_id - liner_od) / 2 * 1000
 
     def vaporizer_tubes(self):
         """
         sizes candy canes
         """
-        circumference = math.pi * self.res['liner_id_mm']
+        res = self.res
+        circumference = math.pi * res.liner_id_mm
         n_tubes = int(circumference / 35.0) #pitch is ~35mm
         if n_tubes % 2 != 0: n_tubes += 1
-        m_fuel_per_tube = self.res['mdot_fuel'] / n_tubes
+        m_fuel_per_tube = res.mdot_fuel / n_tubes
         #vel. sizing
-        rho_fuel = self.FUEL['RHO_LIQ']
-        target_v = self.DESIGN_PARAMS['target_tube_liq_vel']
+        rho_fuel = self._RHO_LIQ
+        target_v = self._V_TUBE_LIQ
         area_internal = m_fuel_per_tube / (rho_fuel * target_v)
         id_tube = math.sqrt(area_internal / math.pi) * 2
         id_tube = max(id_tube, 0.004) #min 4mm
         od_tube = id_tube + 0.001 #added thickness must be standard tube thickness
         #vapor exit vel. check
-        rho_vapor = self.res['P2_Pa'] / (self.R * self.FUEL['T_BOIL'])
+        rho_vapor = res.P2_Pa / (self.R * self._T_BOIL)
         v_exit_vapor = m_fuel_per_tube / (rho_vapor * (math.pi*(id_tube/2)**2))
-        self.res['vap_n'] = n_tubes
-        self.res['vap_od_mm'] = od_tube * 1000
-        self.res['vap_id_mm'] = id_tube * 1000
-        self.res['vap_exit_velocity'] = v_exit_vapor
-        self.res['vap_bend_radius_mm'] = (od_tube * 1000) * 1.5
+        res.vap_n = n_tubes
+        res.vap_od_mm = od_tube * 1000
+        res.vap_id_mm = id_tube * 1000
+        res.vap_exit_velocity = v_exit_vapor
+        res.vap_bend_radius_mm = (od_tube * 1000) * 1.5
 
     def hole_sizing(self):
         """
         Gives hole dia. based on pressure drops.
         """
-        dP = self.res['P2_Pa'] * self.DESIGN_PARAMS['target_pressure_drop']
-        Cd = self.DESIGN_PARAMS['discharge_coeff_hole']
-        flow_factor = Cd * math.sqrt(2 * self.res['rho2'] * dP)
-        A_pri = self.res['split_primary'] / flow_factor #areas of holes
-        A_sec = self.res['split_secondary'] / flow_factor
-        A_dil = self.res['split_dilution'] / flow_factor
-        n_pri = self.res['vap_n'] * 2 #hole geom
+        res = self.res
+        dP = res.P2_Pa * self._DP_LINER
+        Cd = self._CD_HOLE
+        flow_factor = Cd * math.sqrt(2 * res.rho2 * dP)
+        A_pri = res.split_primary / flow_factor #areas of holes
+        A_sec = res.split_secondary / flow_factor
+        A_dil = res.split_dilution / flow_factor
+        n_pri = res.vap_n * 2 #hole geom
         d_pri = math.sqrt(4 * (A_pri/n_pri) / math.pi)
-        n_sec = self.res['vap_n']
+        n_sec = res.vap_n
         d_sec = math.sqrt(4 * (A_sec/n_sec) / math.pi)
-        n_dil = self.res['vap_n']
+        n_dil = res.vap_n
         d_dil = math.sqrt(4 * (A_dil/n_dil) / math.pi)
-        self.res['holes_pri_qty'] = n_pri
-        self.res['holes_pri_mm'] = d_pri * 1000
-        self.res['holes_sec_qty'] = n_sec
-        self.res['holes_sec_mm'] = d_sec * 1000
-        self.res['holes_dil_qty'] = n_dil
-        self.res['holes_dil_mm'] = d_dil * 1000
+        res.holes_pri_qty = n_pri
+        res.holes_pri_mm = d_pri * 1000
+        res.holes_sec_qty = n_sec
+        res.holes_sec_mm = d_sec * 1000
+        res.holes_dil_qty = n_dil
+        res.holes_dil_mm = d_dil * 1000
 
-    def run(self):
-        self.thermodynamics()
-        self.mass_flow_and_fuel()
-        self.zonal_analysis()
+    def _key(self):
+        """
+        Everything the results depend on: class (which holds the constants) and inputs
+        """
+        return type(self), tuple(sorted(self.inputs.items()))
+
+    def _run_impl(self):
+        self._full_pipeline()
         self.mechanical_geometry()
         self.vaporizer_tubes()
         self.hole_sizing()
         return self.res
 
+    def run(self):
+        key = self._key()
+        try:
+            hash(key)
+        except TypeError: #unhashable input value, run without the cache
+            self.res = CombustorResults()
+            return self._run_impl()
+        self.res = replace(_compute(key)) #copy so callers can't poison the cache
+        return self.res
+
+MicroJetCombustor._bind_constants()
+
+@lru_cache(maxsize=64)
+def _compute(key):
+    """
+    Full pipeline for one class/inputs combination
+    """
+    cls, inputs = key
+    c = cls(dict(inputs))
+    c._run_impl()
+    return c.res
+
 def print_report(res, original_inputs):
-    print("\n")
-    print(f"Reverse Flow Combustor (Rev 8 - Variable Cp)")
-    print(f"\n[1] Thermo")
-    print(f"   Inlet Temp (T2):  {res['T2_K']:.0f} K")
-    print(f"   Target TIT:       {original_inputs['target_tit_k']} K")
-    print(f"   Est. Pilot Temp:  {res['T_primary_zone_est']:.0f} K (Rich Zone)")
-    print(f"   Cp (Avg Used):    {res['cp_used']:.1f} J/kgK")
-    print(f"\n[2] Flow Budget")
-    print(f"   Total Air:        {res['mdot_air']:.3f} kg/s")
-    print(f"   Total Fuel:       {res['mdot_fuel']*1000:.1f} g/s")
-    print(f"   Air Split:        Pri: {res['split_primary']/res['mdot_air']:.1%} | Sec: {res['split_secondary']/res['mdot_air']:.1%} | Dil: {res['split_dilution']/res['mdot_air']:.1%}")
+    lines = [
+        "\n",
+        f"Reverse Flow Combustor (Rev 8 - Variable Cp)",
+        f"\n[1] Thermo",
+        f"   Inlet Temp (T2):  {res['T2_K']:.0f} K",
+        f"   Target TIT:       {original_inputs['target_tit_k']} K",
+        f"   Est. Pilot Temp:  {res['T_primary_zone_est']:.0f} K (Rich Zone)",
+        f"   Cp (Avg Used):    {res['cp_used']:.1f} J/kgK",
+        f"\n[2] Flow Budget",
+        f"   Total Air:        {res['mdot_air']:.3f} kg/s",
+        f"   Total Fuel:       {res['mdot_fuel']*1000:.1f} g/s",
+        f"   Air Split:        Pri: {res['split_primary']/res['mdot_air']:.1%} | Sec: {res['split_secondary']/res['mdot_air']:.1%} | Dil: {res['split_dilution']/res['mdot_air']:.1%}",
+    ]
     if res['split_dilution'] <= 0:
-        print(f"   *** Zero dilution air. Engine runs too hot for target TIT.")
-    print(f"\n[3] Geometry (Based on {original_inputs['casing_od_inch']}\" OD)")
-    print(f"   Liner OD:         {res['liner_od_mm']:.1f} mm")
-    print(f"   Liner ID:         {res['liner_id_mm']:.1f} mm")
-    print(f"   Annulus Gap:      {res['annulus_gap_mm']:.1f} mm")
-    print(f"   Length:           {res['chamber_length_mm']:.1f} mm")
-    print(f"\n[4] Mixing + Injection")
-    print(f"   Vaporizers:       {res['vap_n']} tubes")
-    print(f"   Tube Dims:        {res['vap_od_mm']:.1f}mm OD / {res['vap_id_mm']:.1f}mm ID")
-    print(f"   Vapor Velocity:   {res['vap_exit_velocity']:.1f} m/s")
-    print(f"NOTE: Although we want this to be 50-80m/s to prevent flashback, this doesn't  account\n\
+        lines.append(f"   *** Zero dilution air. Engine runs too hot for target TIT.")
+    lines += [
+        f"\n[3] Geometry (Based on {original_inputs['casing_od_inch']}\" OD)",
+        f"   Liner OD:         {res['liner_od_mm']:.1f} mm",
+        f"   Liner ID:         {res['liner_id_mm']:.1f} mm",
+        f"   Annulus Gap:      {res['annulus_gap_mm']:.1f} mm",
+        f"   Length:           {res['chamber_length_mm']:.1f} mm",
+        f"\n[4] Mixing + Injection",
+        f"   Vaporizers:       {res['vap_n']} tubes",
+        f"   Tube Dims:        {res['vap_od_mm']:.1f}mm OD / {res['vap_id_mm']:.1f}mm ID",
+        f"   Vapor Velocity:   {res['vap_exit_velocity']:.1f} m/s",
+        f"NOTE: Although we want this to be 50-80m/s to prevent flashback, this doesn't  account\n\
 for crimping the exits of the fuel tubes (essestially making small nozzles that will accelerate\n\
-the fuel to ~2.5x its velocity). For ref: {res['vap_exit_velocity']/.4:.1f} m/s")
-    print(f"\n[5] Hole Sizing")
-    print(f"   Primary:          {res['holes_pri_qty']} x {res['holes_pri_mm']:.1f} mm")
-    print(f"   Secondary:        {res['holes_sec_qty']} x {res['holes_sec_mm']:.1f} mm")
-    print(f"   Dilution:         {res['holes_dil_qty']} x {res['holes_dil_mm']:.1f} mm")
-    print()
+the fuel to ~2.5x its velocity). For ref: {res['vap_exit_velocity']/.4:.1f} m/s",
+        f"\n[5] Hole Sizing",
+        f"   Primary:          {res['holes_pri_qty']} x {res['holes_pri_mm']:.1f} mm",
+        f"   Secondary:        {res['holes_sec_qty']} x {res['holes_sec_mm']:.1f} mm",
+        f"   Dilution:         {res['holes_dil_qty']} x {res['holes_dil_mm']:.1f} mm",
+        "",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n") #one write instead of a print per line
 #--#--#_#_#
 #############
 user_inputs = {
@@ -1,8 +1,23 @@
+import json
+from collections.abc import Mapping
+from types import MappingProxyType
+
 import pytest
-from V5_CombustionChamber_Design import MicroJetCombustor, print_report
+from V5_CombustionChamber_Design import MicroJetCombustor, RESULT_KEYS, print_report
 
 
-@pytest.fixture
+EXPECTED_KEYS = frozenset([
+    'P2_Pa', 'T2_K', 'rho2',
+    'mdot_air', 'mdot_fuel', 'overall_AFR',
+    'split_primary', 'split_secondary', 'split_dilution',
+    'liner_od_mm', 'liner_id_mm', 'chamber_length_mm',
+    'vap_n', 'vap_od_mm', 'vap_id_mm',
+    'holes_pri_qty', 'holes_pri_mm',
+    'holes_sec_qty', 'holes_sec_mm',
+    'holes_dil_qty', 'holes_dil_mm'
+])
+
+@pytest.fixture(scope="session")
 def kj66_inputs():
     return {
         'casing_od_inch': 4.33,
@@ -14,7 +29,7 @@ def kj66_inputs():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def custom_inputs():
     return {
         'casing_od_inch': 6.0,
@@ -26,16 +41,50 @@ def custom_inputs():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def kj66_combustor(kj66_inputs):
-    return MicroJetCombustor(kj66_inputs)
+    combustor = MicroJetCombustor(kj66_inputs)
+    combustor.run()
+    return combustor
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def kj66_results(kj66_combustor):
+    return kj66_combustor.res
+
+
+@pytest.fixture(scope="session")
 def custom_combustor(custom_inputs):
     return MicroJetCombustor(custom_inputs)
 
 
+@pytest.fixture
+def fresh_combustor(kj66_inputs):
+    return MicroJetCombustor(kj66_inputs)
+
+
+@pytest.fixture(scope="module")
+def kj66_fueled(kj66_inputs):
+    combustor = MicroJetCombustor(kj66_inputs)
+    combustor.thermodynamics()
+    combustor.mass_flow_and_fuel()
+    return combustor
+
+
+@pytest.fixture(scope="module")
+def kj66_zonal(kj66_inputs):
+    combustor = MicroJetCombustor(kj66_inputs)
+    combustor.thermodynamics()
+    combustor.mass_flow_and_fuel()
+    combustor.zonal_analysis()
+    return combustor
+
+
+@pytest.fixture
+def make_combustor(kj66_combustor):
+    return kj66_combustor.with_overrides
+
+
 class TestMicroJetCombustorInit:
 
     def test_inputs_stored(self, kj66_combustor, kj66_inputs):
@@ -53,6 +102,21 @@ class TestMicroJetCombustorInit:
         assert 'discharge_coeff_hole' in params
         assert 'max_LD_ratio' in params
 
+    def test_with_overrides_leaves_original(self, kj66_combustor, kj66_inputs):
+        high = kj66_combustor.with_overrides(pressure_ratio=3.0)
+        assert high.inputs['pressure_ratio'] == 3.0
+        assert kj66_combustor.inputs == kj66_inputs
+        assert len(high.res) == 0
+        assert len(kj66_combustor.res) > 0
+
+    def test_constants_read_only(self, kj66_combustor):
+        with pytest.raises(TypeError):
+            kj66_combustor.DESIGN_PARAMS['max_LD_ratio'] = 2.0
+        with pytest.raises(TypeError):
+            kj66_combustor.FUEL['LHV'] = 40.0e6
+        with pytest.raises(AttributeError):
+            kj66_combustor.R = 300.0
+
     def test_fuel_params_exist(self, kj66_combustor):
         fuel = kj66_combustor.FUEL
         assert fuel['LHV'] == 43.0e6
@@ -71,6 +135,16 @@ class TestCpCalculation:
         cp = kj66_combustor._get_cp(1500)
         assert cp > kj66_combustor._get_cp(300)
 
+    def test_cp_reference_values(self, kj66_combustor):
+        # NASA air fit, cp(300 K) ~ 1005 and cp(1000 K) ~ 1141 J/kgK
+        assert kj66_combustor._get_cp(300) == pytest.approx(1005, rel=1e-3)
+        assert kj66_combustor._get_cp(1000) == pytest.approx(1141, rel=1e-3)
+
+    def test_cp_continuous_across_intervals(self, kj66_combustor):
+        below = kj66_combustor._get_cp(999.999)
+        above = kj66_combustor._get_cp(1000)
+        assert below == pytest.approx(above, rel=1e-5)
+
     def test_cp_clamped_low(self, kj66_combustor):
         cp_low = kj66_combustor._get_cp(100)
         cp_200 = kj66_combustor._get_cp(200)
@@ -81,75 +155,92 @@ class TestCpCalculation:
         cp_2000 = kj66_combustor._get_cp(2000)
         assert cp_high == cp_2000
 
+    def test_cp_repeat_lookups_cached(self, kj66_combustor):
+        kj66_combustor._get_cp(1234)
+        hits = kj66_combustor._get_cp.cache_info().hits
+        kj66_combustor._get_cp(1234)
+        assert kj66_combustor._get_cp.cache_info().hits == hits + 1
+
 
 class TestThermodynamics:
 
-    def test_thermodynamics_sets_pressure(self, kj66_combustor, kj66_inputs):
-        kj66_combustor.thermodynamics()
+    def test_thermodynamics_sets_pressure(self, fresh_combustor, kj66_inputs):
+        fresh_combustor.thermodynamics()
         P_amb = 101325
         expected_P2 = P_amb * kj66_inputs['pressure_ratio']
-        assert kj66_combustor.res['P2_Pa'] == pytest.approx(expected_P2, rel=1e-6)
+        assert fresh_combustor.res['P2_Pa'] == pytest.approx(expected_P2, rel=1e-6)
 
-    def test_thermodynamics_sets_temperature(self, kj66_combustor):
-        kj66_combustor.thermodynamics()
-        T2 = kj66_combustor.res['T2_K']
+    def test_thermodynamics_sets_temperature(self, fresh_combustor):
+        fresh_combustor.thermodynamics()
+        T2 = fresh_combustor.res['T2_K']
         assert T2 > 288.15
 
-    def test_thermodynamics_sets_density(self, kj66_combustor):
-        kj66_combustor.thermodynamics()
-        rho2 = kj66_combustor.res['rho2']
-        expected_rho = kj66_combustor.res['P2_Pa'] / (287.05 * kj66_combustor.res['T2_K'])
+    def test_thermodynamics_sets_density(self, fresh_combustor):
+        fresh_combustor.thermodynamics()
+        rho2 = fresh_combustor.res['rho2']
+        expected_rho = fresh_combustor.res['P2_Pa'] / (287.05 * fresh_combustor.res['T2_K'])
         assert rho2 == pytest.approx(expected_rho, rel=1e-6)
 
-    def test_higher_pr_gives_higher_temp(self, kj66_inputs):
-        low_pr_inputs = kj66_inputs.copy()
-        low_pr_inputs['pressure_ratio'] = 1.5
-        high_pr_inputs = kj66_inputs.copy()
-        high_pr_inputs['pressure_ratio'] = 3.0
-
-        low_combustor = MicroJetCombustor(low_pr_inputs)
-        high_combustor = MicroJetCombustor(high_pr_inputs)
+    def test_higher_pr_gives_higher_temp(self, make_combustor):
+        low_combustor = make_combustor(pressure_ratio=1.5)
+        high_combustor = make_combustor(pressure_ratio=3.0)
 
         low_combustor.thermodynamics()
         high_combustor.thermodynamics()
 
         assert high_combustor.res['T2_K'] > low_combustor.res['T2_K']
 
+    def test_inputs_edited_after_construction(self, kj66_inputs, make_combustor):
+        edited = MicroJetCombustor(dict(kj66_inputs))
+        edited.inputs['pressure_ratio'] = 3.0
+        edited.thermodynamics()
+        fresh = make_combustor(pressure_ratio=3.0)
+        fresh.thermodynamics()
+        assert edited.res['T2_K'] == fresh.res['T2_K']
+
+    def test_subclass_gamma_used(self, fresh_combustor, kj66_inputs):
+        class Monatomic(MicroJetCombustor):
+            GAMMA = 5 / 3
+        mono = Monatomic(kj66_inputs)
+        mono.thermodynamics()
+        fresh_combustor.thermodynamics()
+        assert mono.res['T2_K'] > fresh_combustor.res['T2_K']
+
+    def test_later_stages_not_populated(self, fresh_combustor):
+        fresh_combustor.thermodynamics()
+        assert 'T2_K' in fresh_combustor.res
+        assert 'mdot_air' not in fresh_combustor.res
+        assert len(fresh_combustor.res) == 3
+        with pytest.raises(KeyError):
+            fresh_combustor.res['mdot_air']
+
+    def test_thermodynamics_needs_only_compressor_inputs(self):
+        combustor = MicroJetCombustor({'pressure_ratio': 2.2, 'compressor_efficiency': 0.74})
+        combustor.thermodynamics()
+        assert set(combustor.res) == {'P2_Pa', 'T2_K', 'rho2'}
+
 
 class TestMassFlowAndFuel:
 
-    def test_air_mass_flow_from_input(self, kj66_combustor, kj66_inputs):
-        kj66_combustor.thermodynamics()
-        kj66_combustor.mass_flow_and_fuel()
-        assert kj66_combustor.res['mdot_air'] == kj66_inputs['mass_flow_air_kg_s']
+    def test_air_mass_flow_from_input(self, kj66_fueled, kj66_inputs):
+        assert kj66_fueled.res['mdot_air'] == kj66_inputs['mass_flow_air_kg_s']
 
-    def test_fuel_mass_flow_positive(self, kj66_combustor):
-        kj66_combustor.thermodynamics()
-        kj66_combustor.mass_flow_and_fuel()
-        assert kj66_combustor.res['mdot_fuel'] > 0
+    def test_fuel_mass_flow_positive(self, kj66_fueled):
+        assert kj66_fueled.res['mdot_fuel'] > 0
 
-    def test_afr_reasonable(self, kj66_combustor):
-        kj66_combustor.thermodynamics()
-        kj66_combustor.mass_flow_and_fuel()
-        afr = kj66_combustor.res['overall_AFR']
+    def test_afr_reasonable(self, kj66_fueled):
+        afr = kj66_fueled.res['overall_AFR']
         assert afr > 14.7
 
-    def test_autoscale_mass_flow(self, kj66_inputs):
-        inputs_no_flow = kj66_inputs.copy()
-        inputs_no_flow['mass_flow_air_kg_s'] = None
-        combustor = MicroJetCombustor(inputs_no_flow)
+    def test_autoscale_mass_flow(self, make_combustor):
+        combustor = make_combustor(mass_flow_air_kg_s=None)
         combustor.thermodynamics()
         combustor.mass_flow_and_fuel()
         assert combustor.res['mdot_air'] > 0
 
-    def test_higher_tit_needs_more_fuel(self, kj66_inputs):
-        low_tit = kj66_inputs.copy()
-        low_tit['target_tit_k'] = 900.0
-        high_tit = kj66_inputs.copy()
-        high_tit['target_tit_k'] = 1200.0
-
-        low_combustor = MicroJetCombustor(low_tit)
-        high_combustor = MicroJetCombustor(high_tit)
+    def test_higher_tit_needs_more_fuel(self, make_combustor):
+        low_combustor = make_combustor(target_tit_k=900.0)
+        high_combustor = make_combustor(target_tit_k=1200.0)
 
         low_combustor.thermodynamics()
         low_combustor.mass_flow_and_fuel()
@@ -161,162 +252,164 @@ class TestMassFlowAndFuel:
 
 class TestZonalAnalysis:
 
-    def test_air_splits_sum_to_total(self, kj66_combustor):
-        kj66_combustor.thermodynamics()
-        kj66_combustor.mass_flow_and_fuel()
-        kj66_combustor.zonal_analysis()
-
-        total = (kj66_combustor.res['split_primary'] +
-                 kj66_combustor.res['split_secondary'] +
-                 kj66_combustor.res['split_dilution'])
-        assert total == pytest.approx(kj66_combustor.res['mdot_air'], rel=1e-6)
+    def test_air_splits_sum_to_total(self, kj66_zonal):
+        res = kj66_zonal.res
+        total = res['split_primary'] + res['split_secondary'] + res['split_dilution']
+        assert total == pytest.approx(res['mdot_air'], rel=1e-6)
 
-    def test_primary_zone_positive(self, kj66_combustor):
-        kj66_combustor.thermodynamics()
-        kj66_combustor.mass_flow_and_fuel()
-        kj66_combustor.zonal_analysis()
-        assert kj66_combustor.res['split_primary'] > 0
+    def test_primary_zone_positive(self, kj66_zonal):
+        assert kj66_zonal.res['split_primary'] > 0
 
-    def test_secondary_zone_positive(self, kj66_combustor):
-        kj66_combustor.thermodynamics()
-        kj66_combustor.mass_flow_and_fuel()
-        kj66_combustor.zonal_analysis()
-        assert kj66_combustor.res['split_secondary'] > 0
+    def test_secondary_zone_positive(self, kj66_zonal):
+        assert kj66_zonal.res['split_secondary'] > 0
 
-    def test_primary_temp_higher_than_inlet(self, kj66_combustor):
-        kj66_combustor.thermodynamics()
-        kj66_combustor.mass_flow_and_fuel()
-        kj66_combustor.zonal_analysis()
-        assert kj66_combustor.res['T_primary_zone_est'] > kj66_combustor.res['T2_K']
+    def test_primary_temp_higher_than_inlet(self, kj66_zonal):
+        res = kj66_zonal.res
+        assert res['T_primary_zone_est'] > res['T2_K']
 
 
 class TestMechanicalGeometry:
 
     def test_liner_smaller_than_casing(self, kj66_combustor):
-        kj66_combustor.run()
-        assert kj66_combustor.res['liner_od_mm'] < kj66_combustor.res['casing_id_mm']
+        res = kj66_combustor.res
+        assert res['liner_od_mm'] < res['casing_id_mm']
 
     def test_liner_id_smaller_than_od(self, kj66_combustor):
-        kj66_combustor.run()
-        assert kj66_combustor.res['liner_id_mm'] < kj66_combustor.res['liner_od_mm']
+        res = kj66_combustor.res
+        assert res['liner_id_mm'] < res['liner_od_mm']
 
     def test_annulus_gap_positive(self, kj66_combustor):
-        kj66_combustor.run()
         assert kj66_combustor.res['annulus_gap_mm'] > 0
 
     def test_chamber_length_respects_ld_ratio(self, kj66_combustor):
-        kj66_combustor.run()
-        expected_length = kj66_combustor.res['liner_od_mm'] * kj66_combustor.DESIGN_PARAMS['max_LD_ratio']
-        assert kj66_combustor.res['chamber_length_mm'] == pytest.approx(expected_length, rel=1e-6)
+        res = kj66_combustor.res
+        expected_length = res['liner_od_mm'] * kj66_combustor.DESIGN_PARAMS['max_LD_ratio']
+        assert res['chamber_length_mm'] == pytest.approx(expected_length, rel=1e-6)
+
+    def test_design_params_override_used(self, kj66_inputs, kj66_results):
+        class LongChamber(MicroJetCombustor):
+            DESIGN_PARAMS = MappingProxyType({**MicroJetCombustor.DESIGN_PARAMS, 'max_LD_ratio': 2.0})
+        res = LongChamber(kj66_inputs).run()
+        assert res['chamber_length_mm'] == pytest.approx(res['liner_od_mm'] * 2.0, rel=1e-6)
+        assert res['chamber_length_mm'] > kj66_results['chamber_length_mm']
 
 
 class TestVaporizerTubes:
 
-    def test_even_number_of_tubes(self, kj66_combustor):
-        kj66_combustor.run()
-        assert kj66_combustor.res['vap_n'] % 2 == 0
+    def test_even_number_of_tubes(self, kj66_results):
+        assert kj66_results['vap_n'] % 2 == 0
 
-    def test_tube_od_greater_than_id(self, kj66_combustor):
-        kj66_combustor.run()
-        assert kj66_combustor.res['vap_od_mm'] > kj66_combustor.res['vap_id_mm']
+    def test_tube_od_greater_than_id(self, kj66_results):
+        assert kj66_results['vap_od_mm'] > kj66_results['vap_id_mm']
 
-    def test_minimum_tube_id(self, kj66_combustor):
-        kj66_combustor.run()
-        assert kj66_combustor.res['vap_id_mm'] >= 4.0
+    def test_minimum_tube_id(self, kj66_results):
+        assert kj66_results['vap_id_mm'] >= 4.0
 
-    def test_vapor_exit_velocity_positive(self, kj66_combustor):
-        kj66_combustor.run()
-        assert kj66_combustor.res['vap_exit_velocity'] > 0
+    def test_vapor_exit_velocity_positive(self, kj66_results):
+        assert kj66_results['vap_exit_velocity'] > 0
 
 
 class TestHoleSizing:
 
-    def test_primary_holes_positive(self, kj66_combustor):
-        kj66_combustor.run()
-        assert kj66_combustor.res['holes_pri_qty'] > 0
-        assert kj66_combustor.res['holes_pri_mm'] > 0
+    def test_primary_holes_positive(self, kj66_results):
+        assert kj66_results['holes_pri_qty'] > 0
+        assert kj66_results['holes_pri_mm'] > 0
 
-    def test_secondary_holes_positive(self, kj66_combustor):
-        kj66_combustor.run()
-        assert kj66_combustor.res['holes_sec_qty'] > 0
-        assert kj66_combustor.res['holes_sec_mm'] > 0
+    def test_secondary_holes_positive(self, kj66_results):
+        assert kj66_results['holes_sec_qty'] > 0
+        assert kj66_results['holes_sec_mm'] > 0
 
-    def test_dilution_holes_exist_when_needed(self, kj66_combustor):
-        kj66_combustor.run()
-        if kj66_combustor.res['split_dilution'] > 0:
-            assert kj66_combustor.res['holes_dil_mm'] > 0
+    def test_dilution_holes_exist_when_needed(self, kj66_results):
+        if kj66_results['split_dilution'] > 0:
+            assert kj66_results['holes_dil_mm'] > 0
 
-    def test_primary_holes_twice_vaporizer_count(self, kj66_combustor):
-        kj66_combustor.run()
-        assert kj66_combustor.res['holes_pri_qty'] == kj66_combustor.res['vap_n'] * 2
+    def test_primary_holes_twice_vaporizer_count(self, kj66_results):
+        assert kj66_results['holes_pri_qty'] == kj66_results['vap_n'] * 2
 
 
 class TestIntegration:
 
-    def test_full_run_completes(self, kj66_combustor):
-        results = kj66_combustor.run()
-        assert results is not None
-        assert len(results) > 0
-
-    def test_run_returns_all_expected_keys(self, kj66_combustor):
-        results = kj66_combustor.run()
-        expected_keys = [
-            'P2_Pa', 'T2_K', 'rho2',
-            'mdot_air', 'mdot_fuel', 'overall_AFR',
-            'split_primary', 'split_secondary', 'split_dilution',
-            'liner_od_mm', 'liner_id_mm', 'chamber_length_mm',
-            'vap_n', 'vap_od_mm', 'vap_id_mm',
-            'holes_pri_qty', 'holes_pri_mm',
-            'holes_sec_qty', 'holes_sec_mm',
-            'holes_dil_qty', 'holes_dil_mm'
-        ]
-        for key in expected_keys:
-            assert key in results, f"Missing key: {key}"
-
-    def test_kj66_realistic_values(self, kj66_combustor):
-        results = kj66_combustor.run()
-        assert 200000 < results['P2_Pa'] < 250000
-        assert 0.003 < results['mdot_fuel'] < 0.008
-        assert results['liner_od_mm'] < 130
+    def test_full_run_completes(self, kj66_results):
+        assert kj66_results is not None
+        assert len(kj66_results) > 0
+
+    def test_run_returns_all_expected_keys(self, kj66_results):
+        missing = EXPECTED_KEYS - kj66_results.keys()
+        assert not missing, f"Missing keys: {missing}"
+
+    def test_result_keys_cover_expected(self, kj66_results):
+        assert EXPECTED_KEYS <= set(RESULT_KEYS)
+        assert tuple(kj66_results.keys()) == RESULT_KEYS
+
+    def test_kj66_realistic_values(self, kj66_results):
+        assert 200000 < kj66_results['P2_Pa'] < 250000
+        assert 0.003 < kj66_results['mdot_fuel'] < 0.008
+        assert kj66_results['liner_od_mm'] < 130
+
+    def test_results_behave_like_mapping(self, kj66_results):
+        assert isinstance(kj66_results, Mapping)
+        assert 'keys' not in kj66_results
+        assert 'as_dict' not in list(kj66_results)
+        assert kj66_results == dict(kj66_results.items())
+        assert kj66_results.get('not_a_key', 0) == 0
+        assert json.loads(json.dumps(kj66_results.as_dict())) == kj66_results
+
+    def test_run_cached_for_identical_inputs(self, kj66_inputs):
+        first = MicroJetCombustor(dict(kj66_inputs)).run()
+        assert MicroJetCombustor(dict(kj66_inputs)).run() == first
+
+    def test_run_result_mutation_does_not_leak(self, kj66_inputs):
+        first = MicroJetCombustor(kj66_inputs).run()
+        expected = first['P2_Pa']
+        first['P2_Pa'] = -1.0
+        assert MicroJetCombustor(kj66_inputs).run()['P2_Pa'] == expected
+
+    def test_run_respects_subclass_constants(self, kj66_inputs):
+        class HeavierGas(MicroJetCombustor):
+            R = 300.0
+        baseline = MicroJetCombustor(kj66_inputs).run()
+        assert HeavierGas(kj66_inputs).run()['rho2'] < baseline['rho2']
+
+    def test_run_unhashable_input_uncached(self, kj66_inputs):
+        inputs = {**kj66_inputs, 'notes': ['not', 'hashable']}
+        results = MicroJetCombustor(inputs).run()
+        assert results == MicroJetCombustor(kj66_inputs).run()
+
+    @pytest.mark.parametrize("override", [{}, {'pressure_ratio': 3.0},
+                                          {'mass_flow_air_kg_s': None}, {'target_tit_k': 1200}],
+                             ids=['kj66', 'high_pr', 'autoscale', 'high_tit'])
+    def test_fused_pipeline_matches_stages(self, make_combustor, override):
+        staged = make_combustor(**override)
+        staged.thermodynamics()
+        staged.mass_flow_and_fuel()
+        staged.zonal_analysis()
+        fused = make_combustor(**override)
+        fused._full_pipeline()
+        assert fused.res == staged.res
 
     def test_custom_combustor_runs(self, custom_combustor):
         results = custom_combustor.run()
         assert results is not None
 
-    def test_print_report_no_error(self, kj66_combustor, kj66_inputs, capsys):
-        results = kj66_combustor.run()
-        print_report(results, kj66_inputs)
+    def test_print_report_no_error(self, kj66_results, kj66_inputs, capsys):
+        print_report(kj66_results, kj66_inputs)
         captured = capsys.readouterr()
         assert 'Reverse Flow Combustor' in captured.out
 
 
 class TestEdgeCases:
 
-    def test_low_pressure_ratio(self, kj66_inputs):
-        inputs = kj66_inputs.copy()
-        inputs['pressure_ratio'] = 1.1
-        combustor = MicroJetCombustor(inputs)
-        results = combustor.run()
-        assert results['P2_Pa'] > 101325
-
-    def test_high_efficiency_compressor(self, kj66_inputs):
-        inputs = kj66_inputs.copy()
-        inputs['compressor_efficiency'] = 0.99
-        combustor = MicroJetCombustor(inputs)
-        results = combustor.run()
-        assert results['T2_K'] > 288.15
-
-    def test_thin_wall_thickness(self, kj66_inputs):
-        inputs = kj66_inputs.copy()
-        inputs['wall_thickness_mm'] = 0.1
-        combustor = MicroJetCombustor(inputs)
-        results = combustor.run()
-        assert results['liner_od_mm'] < results['casing_id_mm']
-
-    def test_large_casing(self, kj66_inputs):
-        inputs = kj66_inputs.copy()
-        inputs['casing_od_inch'] = 12.0
-        inputs['mass_flow_air_kg_s'] = 1.0
-        combustor = MicroJetCombustor(inputs)
-        results = combustor.run()
-        assert results['liner_od_mm'] < 12 * 25.4
+    @pytest.mark.parametrize("override,check", [
+        ({'pressure_ratio': 1.1},
+         lambda r: r['P2_Pa'] > 101325),
+        ({'compressor_efficiency': 0.99},
+         lambda r: r['T2_K'] > 288.15),
+        ({'wall_thickness_mm': 0.1},
+         lambda r: r['liner_od_mm'] < r['casing_id_mm']),
+        ({'casing_od_inch': 12.0, 'mass_flow_air_kg_s': 1.0},
+         lambda r: r['liner_od_mm'] < 12 * 25.4),
+    ], ids=['low_pressure_ratio', 'high_efficiency_compressor',
+            'thin_wall_thickness', 'large_casing'])
+    def test_edge_case(self, make_combustor, override, check):
+        results = make_combustor(**override).run()
+        assert check(results)